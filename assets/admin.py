@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, Value, When
+from django.utils import timezone
 from django.utils.html import format_html
 from .models import (
     Department, Employee, Category, Location, 
@@ -6,14 +9,57 @@ from .models import (
 )
 
 
+ASSET_STATUS_COLORS = {
+    'available': '#10b981',
+    'assigned': '#3b82f6',
+    'maintenance': '#f59e0b',
+    'retired': '#6b7280',
+    'lost': '#ef4444',
+}
+
+MAINTENANCE_STATUS_COLORS = {
+    'scheduled': '#3b82f6',
+    'in_progress': '#f59e0b',
+    'completed': '#10b981',
+    'cancelled': '#6b7280',
+}
+
+DEFAULT_BADGE_COLOR = '#6b7280'
+
+ASSET_STATUS_BADGE_HTML = (
+    '<span style="background-color: {}; color: white; padding: 3px 10px; '
+    'border-radius: 15px; font-size: 11px; font-weight: bold;">{}</span>'
+)
+
+MAINTENANCE_STATUS_BADGE_HTML = (
+    '<span style="background-color: {}; color: white; padding: 3px 10px; '
+    'border-radius: 15px; font-size: 11px;">{}</span>'
+)
+
+# Badges for the fixed status choices are rendered once at import time
+ASSET_STATUS_BADGES = {
+    value: format_html(ASSET_STATUS_BADGE_HTML, ASSET_STATUS_COLORS.get(value, DEFAULT_BADGE_COLOR), label)
+    for value, label in Asset.STATUS_CHOICES
+}
+
+MAINTENANCE_STATUS_BADGES = {
+    value: format_html(MAINTENANCE_STATUS_BADGE_HTML, MAINTENANCE_STATUS_COLORS.get(value, DEFAULT_BADGE_COLOR), label)
+    for value, label in MaintenanceRecord.STATUS_CHOICES
+}
+
+
 @admin.register(Department)
 class DepartmentAdmin(admin.ModelAdmin):
     list_display = ['name', 'description', 'employee_count', 'created_at']
     search_fields = ['name']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_employee_count=Count('employee'))
+    
     def employee_count(self, obj):
-        return obj.employee_set.count()
+        return obj._employee_count
     employee_count.short_description = 'Employees'
+    employee_count.admin_order_field = '_employee_count'
 
 
 @admin.register(Employee)
@@ -23,16 +69,20 @@ class EmployeeAdmin(admin.ModelAdmin):
     search_fields = ['employee_id', 'first_name', 'last_name', 'email']
     list_editable = ['is_active']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_asset_count=Count('assets'))
+    
     def full_name(self, obj):
         return obj.full_name
     full_name.short_description = 'Name'
     
     def asset_count(self, obj):
-        count = obj.assets.count()
+        count = obj._asset_count
         if count > 0:
             return format_html('<span style="color: green; font-weight: bold;">{}</span>', count)
         return count
     asset_count.short_description = 'Assets'
+    asset_count.admin_order_field = '_asset_count'
 
 
 @admin.register(Category)
@@ -40,13 +90,17 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'icon_display', 'description', 'asset_count']
     search_fields = ['name']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_asset_count=Count('asset'))
+    
     def icon_display(self, obj):
         return format_html('<i class="{}"></i> {}', obj.icon, obj.icon)
     icon_display.short_description = 'Icon'
     
     def asset_count(self, obj):
-        return obj.asset_set.count()
+        return obj._asset_count
     asset_count.short_description = 'Assets'
+    asset_count.admin_order_field = '_asset_count'
 
 
 @admin.register(Location)
@@ -55,9 +109,13 @@ class LocationAdmin(admin.ModelAdmin):
     list_filter = ['building']
     search_fields = ['name', 'building']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_asset_count=Count('asset'))
+    
     def asset_count(self, obj):
-        return obj.asset_set.count()
+        return obj._asset_count
     asset_count.short_description = 'Assets'
+    asset_count.admin_order_field = '_asset_count'
 
 
 @admin.register(Vendor)
@@ -65,9 +123,13 @@ class VendorAdmin(admin.ModelAdmin):
     list_display = ['name', 'contact_person', 'email', 'phone', 'asset_count']
     search_fields = ['name', 'contact_person', 'email']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_asset_count=Count('asset'))
+    
     def asset_count(self, obj):
-        return obj.asset_set.count()
+        return obj._asset_count
     asset_count.short_description = 'Assets Purchased'
+    asset_count.admin_order_field = '_asset_count'
 
 
 class AssetHistoryInline(admin.TabularInline):
@@ -76,6 +138,9 @@ class AssetHistoryInline(admin.TabularInline):
     readonly_fields = ['action', 'description', 'performed_by', 'old_value', 'new_value', 'created_at']
     can_delete = False
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('performed_by')
+    
     def has_add_permission(self, request, obj=None):
         return False
 
@@ -84,6 +149,9 @@ class MaintenanceRecordInline(admin.TabularInline):
     model = MaintenanceRecord
     extra = 0
     fields = ['maintenance_type', 'status', 'scheduled_date', 'completed_date', 'cost']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('created_by')
 
 
 @admin.register(Asset)
@@ -95,6 +163,7 @@ class AssetAdmin(admin.ModelAdmin):
     list_filter = ['status', 'condition', 'category', 'location', 'vendor']
     search_fields = ['asset_tag', 'name', 'serial_number', 'assigned_to__first_name', 'assigned_to__last_name']
     list_editable = ['condition']
+    list_select_related = ('category', 'assigned_to', 'location')
     readonly_fields = ['created_at', 'updated_at', 'created_by']
     date_hierarchy = 'purchase_date'
     
@@ -124,40 +193,43 @@ class AssetAdmin(admin.ModelAdmin):
     
     inlines = [MaintenanceRecordInline, AssetHistoryInline]
     
-    def status_badge(self, obj):
-        colors = {
-            'available': '#10b981',
-            'assigned': '#3b82f6',
-            'maintenance': '#f59e0b',
-            'retired': '#6b7280',
-            'lost': '#ef4444',
-        }
-        color = colors.get(obj.status, '#6b7280')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; '
-            'border-radius: 15px; font-size: 11px; font-weight: bold;">{}</span>',
-            color, obj.get_status_display()
+    def get_queryset(self, request):
+        today = timezone.now().date()
+        return super().get_queryset(request).annotate(
+            _under_warranty=Case(
+                When(warranty_expiry__gte=today, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
         )
+    
+    def status_badge(self, obj):
+        badge = ASSET_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = format_html(ASSET_STATUS_BADGE_HTML, DEFAULT_BADGE_COLOR, obj.get_status_display())
+        return badge
     status_badge.short_description = 'Status'
     
     def warranty_status(self, obj):
-        if obj.is_under_warranty:
+        if obj._under_warranty:
             return format_html('<span style="color: green;">✓ Valid</span>')
         elif obj.warranty_expiry:
             return format_html('<span style="color: red;">✗ Expired</span>')
         return format_html('<span style="color: gray;">N/A</span>')
     warranty_status.short_description = 'Warranty'
+    warranty_status.admin_order_field = '_under_warranty'
     
     def save_model(self, request, obj, form, change):
         if not change:
             obj.created_by = request.user
-            super().save_model(request, obj, form, change)
-            AssetHistory.objects.create(
-                asset=obj,
-                action='created',
-                description=f'Asset {obj.asset_tag} was created',
-                performed_by=request.user
-            )
+            with transaction.atomic():
+                super().save_model(request, obj, form, change)
+                AssetHistory.objects.create(
+                    asset=obj,
+                    action='created',
+                    description=f'Asset {obj.asset_tag} was created',
+                    performed_by=request.user
+                )
         else:
             super().save_model(request, obj, form, change)
 
@@ -167,9 +239,13 @@ class AssetHistoryAdmin(admin.ModelAdmin):
     list_display = ['asset', 'action', 'description', 'performed_by', 'created_at']
     list_filter = ['action', 'created_at']
     search_fields = ['asset__asset_tag', 'asset__name', 'description']
+    list_select_related = ('asset', 'performed_by')
     readonly_fields = ['asset', 'action', 'description', 'performed_by', 'old_value', 'new_value', 'created_at']
     date_hierarchy = 'created_at'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('asset', 'performed_by')
+    
     def has_add_permission(self, request):
         return False
     
@@ -182,21 +258,17 @@ class MaintenanceRecordAdmin(admin.ModelAdmin):
     list_display = ['asset', 'maintenance_type', 'status_badge', 'scheduled_date', 'completed_date', 'cost']
     list_filter = ['status', 'maintenance_type', 'scheduled_date']
     search_fields = ['asset__asset_tag', 'asset__name', 'description']
+    list_select_related = ('asset',)
     date_hierarchy = 'scheduled_date'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('asset', 'created_by')
+    
     def status_badge(self, obj):
-        colors = {
-            'scheduled': '#3b82f6',
-            'in_progress': '#f59e0b',
-            'completed': '#10b981',
-            'cancelled': '#6b7280',
-        }
-        color = colors.get(obj.status, '#6b7280')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; '
-            'border-radius: 15px; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        badge = MAINTENANCE_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = format_html(MAINTENANCE_STATUS_BADGE_HTML, DEFAULT_BADGE_COLOR, obj.get_status_display())
+        return badge
     status_badge.short_description = 'Status'
 
 
@@ -0,0 +1,12 @@
+"""Cache keys shared by the views that fill the caches and the signals that clear them"""
+
+DASHBOARD_CACHE_KEY = 'dashboard_aggs_v1'
+
+REPORTS_CACHE_KEY = 'reports_v1'
+
+GROUPS_CACHE_KEY = 'assets:all_groups'
+
+
+def reports_cache_key(today):
+    """Reports depend on the date through the warranty buckets, so key them by day"""
+    return f'{REPORTS_CACHE_KEY}:{today.isoformat()}'
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-15 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='asset',
+            name='warranty_expiry',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['-created_at'], name='assets_asse_created_0ad9a6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['status', 'category'], name='assets_asse_status_35fdfb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assethistory',
+            index=models.Index(fields=['-created_at'], name='assets_asse_created_55e07e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerecord',
+            index=models.Index(fields=['-scheduled_date', 'status'], name='assets_main_schedul_2cb3a4_idx'),
+        ),
+    ]
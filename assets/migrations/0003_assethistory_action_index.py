@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0002_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assethistory',
+            index=models.Index(fields=['action', '-created_at'], name='assets_asse_action_982c2a_idx'),
+        ),
+    ]
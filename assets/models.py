@@ -128,7 +128,7 @@ class Asset(models.Model):
     vendor = models.ForeignKey(Vendor, on_delete=models.SET_NULL, null=True, blank=True)
     purchase_date = models.DateField(blank=True, null=True)
     purchase_cost = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
-    warranty_expiry = models.DateField(blank=True, null=True)
+    warranty_expiry = models.DateField(blank=True, null=True, db_index=True)
     
     # Additional Info
     notes = models.TextField(blank=True, null=True)
@@ -149,6 +149,10 @@ class Asset(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', 'category']),
+        ]
 
 
 class AssetHistory(models.Model):
@@ -177,6 +181,10 @@ class AssetHistory(models.Model):
     class Meta:
         verbose_name_plural = "Asset Histories"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['action', '-created_at']),
+        ]
 
 
 class MaintenanceRecord(models.Model):
@@ -213,3 +221,6 @@ class MaintenanceRecord(models.Model):
     
     class Meta:
         ordering = ['-scheduled_date']
+        indexes = [
+            models.Index(fields=['-scheduled_date', 'status']),
+        ]
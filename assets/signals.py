@@ -0,0 +1,32 @@
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache_keys import DASHBOARD_CACHE_KEY, GROUPS_CACHE_KEY, reports_cache_key
+from .models import Asset, Employee, Category, Department, Location
+
+
+@receiver([post_save, post_delete], sender=Asset)
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_dashboard_cache(sender, **kwargs):
+    """Drop cached dashboard aggregates when the underlying data changes"""
+    cache.delete(DASHBOARD_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Asset)
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Location)
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_reports_cache(sender, **kwargs):
+    """Drop today's cached report aggregates when the underlying data changes"""
+    cache.delete(reports_cache_key(timezone.now().date()))
+
+
+@receiver([post_save, post_delete], sender=Group)
+def invalidate_groups_cache(sender, **kwargs):
+    """Drop the cached role list when a group is added, renamed or removed"""
+    cache.delete(GROUPS_CACHE_KEY)
@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Asset, Employee
+
+try:
+    from celery import shared_task
+    TASKS_RUN_INLINE = False
+except ImportError:
+    # Celery not installed: run tasks inline in the request
+    TASKS_RUN_INLINE = True
+    
+    def shared_task(func):
+        func.delay = func
+        return func
+
+
+# ============================================
+# EMAIL NOTIFICATIONS
+# ============================================
+
+def send_assignment_email(asset, employee, assigned_by):
+    """Send email when asset is assigned"""
+    subject = f'Asset Assigned: {asset.asset_tag}'
+    
+    message = render_to_string('assets/emails/assignment.txt', {
+        'asset': asset,
+        'employee': employee,
+        'assigned_by': assigned_by,
+    })
+    
+    send_mail(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        [employee.email],
+        fail_silently=False,
+    )
+
+
+def send_unassignment_email(asset, employee, unassigned_by):
+    """Send email when asset is unassigned"""
+    subject = f'Asset Returned: {asset.asset_tag}'
+    
+    message = render_to_string('assets/emails/unassignment.txt', {
+        'asset': asset,
+        'employee': employee,
+        'unassigned_by': unassigned_by,
+        'date': timezone.now(),
+    })
+    
+    send_mail(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        [employee.email],
+        fail_silently=False,
+    )
+
+
+@shared_task
+def send_assignment_email_task(asset_id, employee_id, user_id):
+    """Send the assignment email outside the request cycle"""
+    asset = Asset.objects.select_related('category').get(pk=asset_id)
+    employee = Employee.objects.get(pk=employee_id)
+    send_assignment_email(asset, employee, User.objects.get(pk=user_id))
+
+
+@shared_task
+def send_unassignment_email_task(asset_id, employee_id, user_id):
+    """Send the unassignment email outside the request cycle"""
+    asset = Asset.objects.get(pk=asset_id)
+    employee = Employee.objects.get(pk=employee_id)
+    send_unassignment_email(asset, employee, User.objects.get(pk=user_id))
+
+
+def expiring_warranty_assets():
+    """Assets whose warranty runs out within the next 30 days"""
+    today = timezone.now().date()
+    # A single BETWEEN on the indexed warranty_expiry DateField. Keep the date
+    # arithmetic on the Python side; a __date lookup or a column-side expression
+    # would wrap the column and stop SQLite from using the index.
+    return Asset.objects.filter(warranty_expiry__range=(today, today + timedelta(days=30)))
+
+
+@shared_task
+def send_warranty_alerts_task(recipient):
+    """Email the list of assets with expiring warranties"""
+    expiring_assets = list(expiring_warranty_assets().only('asset_tag', 'name', 'warranty_expiry'))
+    if not expiring_assets:
+        return
+    
+    subject = f'Warranty Alert: {len(expiring_assets)} assets expiring soon'
+    
+    message = render_to_string('assets/emails/warranty_alert.txt', {'assets': expiring_assets})
+    
+    send_mail(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        [recipient],
+        fail_silently=False,
+    )
@@ -35,6 +35,7 @@ urlpatterns = [
     
     # History
     path('history/', views.history_list, name='history_list'),
+    path('history/export/', views.export_history_csv, name='export_history_csv'),
     
     # Reports
     path('reports/', views.reports, name='reports'),
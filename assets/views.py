@@ -2,59 +2,222 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.models import User, Group
 from django.contrib import messages
-from django.db.models import Count, Sum, Q
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, Count, Sum, Q, Value, When
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
-from django.http import HttpResponse, JsonResponse
-from django.core.mail import send_mail, EmailMessage
+from django.utils.functional import cached_property
+from django.views.decorators.http import etag
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
-from django.conf import settings
 from datetime import timedelta
-import json
+from io import BytesIO
+import base64
+import csv
+import hashlib
 import os
 import io
-
+import tempfile
+
+# Optional libraries; the views that need them report when they are missing
+try:
+    import segno
+except ImportError:
+    segno = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import reportlab
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+except ImportError:
+    reportlab = None
+
+from .cache_keys import DASHBOARD_CACHE_KEY, GROUPS_CACHE_KEY, reports_cache_key
 from .models import (
     Asset, Employee, Category, Department, 
     Location, Vendor, AssetHistory, MaintenanceRecord
 )
+from .tasks import (
+    TASKS_RUN_INLINE,
+    expiring_warranty_assets,
+    send_assignment_email_task,
+    send_unassignment_email_task,
+    send_warranty_alerts_task,
+)
 
 
 # ============================================
-# DASHBOARD
+# PAGINATION
 # ============================================
 
-@login_required
-def dashboard(request):
-    # Get counts
-    total_assets = Asset.objects.count()
-    available_assets = Asset.objects.filter(status='available').count()
-    assigned_assets = Asset.objects.filter(status='assigned').count()
-    maintenance_assets = Asset.objects.filter(status='maintenance').count()
-    retired_assets = Asset.objects.filter(status='retired').count()
+PAGE_SIZE = 50
+
+# Below this many rows the planner estimate is not trusted and an exact COUNT is cheap
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+class FasterPaginator(Paginator):
+    """Paginator that uses PostgreSQL's row estimate for unfiltered tables"""
+    
+    def __init__(self, *args, filters_applied=True, count_queryset=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.filters_applied = filters_applied
+        # Optional lighter queryset (no joins or annotations) used only for COUNT
+        self.count_queryset = count_queryset
+    
+    @cached_property
+    def count(self):
+        if not self.filters_applied and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= ESTIMATED_COUNT_THRESHOLD:
+                return row[0]
+        if self.count_queryset is not None:
+            return self.count_queryset.count()
+        return super().count
+
+
+def paginate(request, queryset, per_page=PAGE_SIZE, filters_applied=True, count_queryset=None):
+    """Paginate a queryset and build the context used by pagination.html"""
+    paginator = FasterPaginator(
+        queryset, per_page, filters_applied=filters_applied, count_queryset=count_queryset
+    )
+    page_obj = paginator.get_page(request.GET.get('page'))
     
-    # Get total value
-    total_value = Asset.objects.aggregate(total=Sum('purchase_cost'))['total'] or 0
+    # Keep active filters when moving between pages
+    params = request.GET.copy()
+    params.pop('page', None)
     
-    # Total employees
-    total_employees = Employee.objects.filter(is_active=True).count()
+    return {
+        'paginator': paginator,
+        'page_obj': page_obj,
+        'page_query': params.urlencode(),
+    }
+
+
+# ============================================
+# FILE DOWNLOADS
+# ============================================
+
+# Chunk size for streamed file downloads
+STREAM_BLOCK_SIZE = 64 * 1024
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Format properties shared by the Excel exports and the import template. Each
+# workbook registers its formats once, before the row loop; adding formats per
+# row would bloat the styles table.
+EXCEL_HEADER_FORMAT = {
+    'bold': True,
+    'bg_color': '#4f46e5',
+    'font_color': 'white',
+    'border': 1,
+    'align': 'center',
+}
+
+EXCEL_CELL_FORMAT = {'border': 1, 'align': 'left'}
+
+
+def file_download(fileobj, filename, content_type):
+    """Serve a finished in-memory or temporary file as an attachment"""
+    # FileResponse only sizes named files and BytesIO; spooled temp files need it set
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    
+    response = FileResponse(fileobj, as_attachment=True, filename=filename, content_type=content_type)
+    response.block_size = STREAM_BLOCK_SIZE
+    response['Content-Length'] = size
+    return response
+
+
+# ============================================
+# DASHBOARD
+# ============================================
+
+DASHBOARD_CACHE_TIMEOUT = 60
+
+
+def _compute_dashboard_aggregates():
+    """Compute the slow-changing dashboard counts and chart data"""
+    # Get counts and total value in a single query
+    agg = Asset.objects.aggregate(
+        total=Count('id'),
+        available=Count('id', filter=Q(status='available')),
+        assigned=Count('id', filter=Q(status='assigned')),
+        maintenance=Count('id', filter=Q(status='maintenance')),
+        retired=Count('id', filter=Q(status='retired')),
+        total_value=Sum('purchase_cost'),
+    )
     
     # Assets by category for chart
-    assets_by_category = Category.objects.annotate(
+    assets_by_category = list(Category.objects.annotate(
         count=Count('asset')
-    ).filter(count__gt=0).order_by('-count')
+    ).filter(count__gt=0).order_by('-count').values('name', 'count'))
+    
+    # Monthly asset additions (last 6 months)
+    monthly_data = Asset.objects.filter(
+        created_at__gte=timezone.now() - timedelta(days=180)
+    ).annotate(
+        month=TruncMonth('created_at')
+    ).values('month').annotate(count=Count('id')).order_by('month')
+    
+    return {
+        'total_assets': agg['total'],
+        'available_assets': agg['available'],
+        'assigned_assets': agg['assigned'],
+        'maintenance_assets': agg['maintenance'],
+        'retired_assets': agg['retired'],
+        'total_value': agg['total_value'] or 0,
+        'total_employees': Employee.objects.filter(is_active=True).count(),
+        'assets_by_category': assets_by_category,
+        'category_labels': [row['name'] for row in assets_by_category],
+        'category_counts': [row['count'] for row in assets_by_category],
+        'monthly_labels': [item['month'].strftime('%b %Y') for item in monthly_data],
+        'monthly_counts': [item['count'] for item in monthly_data],
+    }
+
+
+@login_required
+def dashboard(request):
+    # Counts and chart aggregates are cached; invalidated by signals.py
+    data = cache.get_or_set(DASHBOARD_CACHE_KEY, _compute_dashboard_aggregates, DASHBOARD_CACHE_TIMEOUT)
     
     # Assets by status for chart
     status_data = {
-        'available': available_assets,
-        'assigned': assigned_assets,
-        'maintenance': maintenance_assets,
-        'retired': retired_assets,
+        'available': data['available_assets'],
+        'assigned': data['assigned_assets'],
+        'maintenance': data['maintenance_assets'],
+        'retired': data['retired_assets'],
     }
     
-    # Recent assets
-    recent_assets = Asset.objects.select_related(
-        'category', 'assigned_to', 'location'
-    ).order_by('-created_at')[:10]
+    today = timezone.now().date()
+    thirty_days = today + timedelta(days=30)
     
     # Recent activity
     recent_activity = AssetHistory.objects.select_related(
@@ -64,56 +227,54 @@ def dashboard(request):
     # Upcoming maintenance
     upcoming_maintenance = MaintenanceRecord.objects.filter(
         status__in=['scheduled', 'in_progress'],
-        scheduled_date__gte=timezone.now().date()
+        scheduled_date__gte=today
     ).select_related('asset').order_by('scheduled_date')[:5]
     
-    # Warranty expiring soon (next 30 days)
-    thirty_days = timezone.now().date() + timedelta(days=30)
-    expiring_warranty = Asset.objects.filter(
-        warranty_expiry__lte=thirty_days,
-        warranty_expiry__gte=timezone.now().date()
-    ).order_by('warranty_expiry')[:5]
+    # Recent assets and warranty expiring soon (next 30 days), fetched in one query
+    recent_ids = Asset.objects.order_by('-created_at').values('pk')[:10]
+    expiring_ids = Asset.objects.filter(
+        warranty_expiry__range=(today, thirty_days)
+    ).order_by('warranty_expiry').values('pk')[:5]
+    dashboard_assets = list(Asset.objects.filter(
+        Q(pk__in=recent_ids) | Q(pk__in=expiring_ids)
+    ).select_related(
+        'category', 'assigned_to', 'location'
+    ).only(*ASSET_LIST_FIELDS, 'category__icon', 'created_at', 'warranty_expiry'))
     
-    # Chart data
-    category_labels = [cat.name for cat in assets_by_category]
-    category_counts = [cat.count for cat in assets_by_category]
+    # Re-sorting the combined rows reproduces each slice: any extra row pulled in
+    # by the other subquery falls outside the top N of this ordering
+    recent_assets = sorted(dashboard_assets, key=lambda a: a.created_at, reverse=True)[:10]
+    expiring_warranty = sorted(
+        (a for a in dashboard_assets
+         if a.warranty_expiry and today <= a.warranty_expiry <= thirty_days),
+        key=lambda a: a.warranty_expiry
+    )[:5]
     
     # Status chart data
     status_labels = ['Available', 'Assigned', 'Maintenance', 'Retired']
-    status_counts = [available_assets, assigned_assets, maintenance_assets, retired_assets]
-    
-    # Monthly asset additions (last 6 months)
-    from django.db.models.functions import TruncMonth
-    monthly_data = Asset.objects.filter(
-        created_at__gte=timezone.now() - timedelta(days=180)
-    ).annotate(
-        month=TruncMonth('created_at')
-    ).values('month').annotate(count=Count('id')).order_by('month')
-    
-    monthly_labels = [item['month'].strftime('%b %Y') for item in monthly_data]
-    monthly_counts = [item['count'] for item in monthly_data]
+    status_counts = list(status_data.values())
     
     context = {
-        'total_assets': total_assets,
-        'available_assets': available_assets,
-        'assigned_assets': assigned_assets,
-        'maintenance_assets': maintenance_assets,
-        'retired_assets': retired_assets,
-        'total_value': total_value,
-        'total_employees': total_employees,
-        'assets_by_category': assets_by_category,
+        'total_assets': data['total_assets'],
+        'available_assets': data['available_assets'],
+        'assigned_assets': data['assigned_assets'],
+        'maintenance_assets': data['maintenance_assets'],
+        'retired_assets': data['retired_assets'],
+        'total_value': data['total_value'],
+        'total_employees': data['total_employees'],
+        'assets_by_category': data['assets_by_category'],
         'status_data': status_data,
         'recent_assets': recent_assets,
         'recent_activity': recent_activity,
         'upcoming_maintenance': upcoming_maintenance,
         'expiring_warranty': expiring_warranty,
-        # Chart data as JSON
-        'category_labels': json.dumps(category_labels),
-        'category_counts': json.dumps(category_counts),
-        'status_labels': json.dumps(status_labels),
-        'status_counts': json.dumps(status_counts),
-        'monthly_labels': json.dumps(monthly_labels),
-        'monthly_counts': json.dumps(monthly_counts),
+        # Chart data, serialized in the template with json_script
+        'category_labels': data['category_labels'],
+        'category_counts': data['category_counts'],
+        'status_labels': status_labels,
+        'status_counts': status_counts,
+        'monthly_labels': data['monthly_labels'],
+        'monthly_counts': data['monthly_counts'],
     }
     return render(request, 'assets/dashboard.html', context)
 
@@ -122,9 +283,18 @@ def dashboard(request):
 # ASSETS
 # ============================================
 
+# Columns rendered by asset tables; keeps wide text fields out of the SELECT
+ASSET_LIST_FIELDS = (
+    'asset_tag', 'name', 'status', 'condition',
+    'category__name', 'assigned_to__first_name', 'assigned_to__last_name', 'location__name',
+)
+
+
 @login_required
 def asset_list(request):
-    assets = Asset.objects.select_related('category', 'assigned_to', 'location').all()
+    assets = Asset.objects.select_related(
+        'category', 'assigned_to', 'location'
+    ).only(*ASSET_LIST_FIELDS)
     
     # Search
     search = request.GET.get('search', '')
@@ -155,24 +325,39 @@ def asset_list(request):
     categories = Category.objects.all()
     locations = Location.objects.all()
     
+    pagination = paginate(
+        request, assets,
+        filters_applied=any([search, status, category, location])
+    )
+    
     context = {
-        'assets': assets,
+        'assets': pagination['page_obj'],
         'categories': categories,
         'locations': locations,
         'search': search,
         'status': status,
         'selected_category': category,
         'selected_location': location,
-        'total_count': assets.count(),
+        'total_count': pagination['paginator'].count,
+        **pagination,
     }
     return render(request, 'assets/asset_list.html', context)
 
 
 @login_required
 def asset_detail(request, pk):
-    asset = get_object_or_404(Asset, pk=pk)
-    history = asset.history.all()[:20]
-    maintenance = asset.maintenance_records.all()[:10]
+    asset = get_object_or_404(
+        Asset.objects.select_related(
+            'category', 'assigned_to__department', 'location', 'vendor', 'created_by'
+        ),
+        pk=pk,
+    )
+    history = AssetHistory.objects.filter(asset=asset).select_related(
+        'performed_by'
+    ).order_by('-created_at')[:20]
+    maintenance = MaintenanceRecord.objects.filter(asset=asset).select_related(
+        'created_by'
+    ).order_by('-scheduled_date')[:10]
     
     # Generate QR code URL
     qr_url = f"/app/assets/{pk}/qrcode/"
@@ -186,47 +371,71 @@ def asset_detail(request, pk):
     return render(request, 'assets/asset_detail.html', context)
 
 
+# Without Celery the email tasks run inline, so the mail has already gone out
+EMAIL_STATUS = 'sent' if TASKS_RUN_INLINE else 'queued'
+
+
+def notify_on_commit(request, task, args, success, failure):
+    """Send an email task once the transaction commits, reporting the outcome as a message"""
+    def send():
+        try:
+            task.delay(*args)
+            messages.success(request, success)
+        except Exception as e:
+            # SMTP errors (inline) or an unreachable broker must not fail the request
+            messages.warning(request, f'{failure}: {str(e)}')
+    
+    transaction.on_commit(send)
+
+
 @login_required
 def assign_asset(request, pk):
-    asset = get_object_or_404(Asset, pk=pk)
+    asset = get_object_or_404(Asset.objects.select_related('assigned_to'), pk=pk)
     
     if request.method == 'POST':
         employee_id = request.POST.get('employee_id')
         send_email = request.POST.get('send_email', False)
         
         if employee_id:
-            employee = get_object_or_404(Employee, pk=employee_id)
-            old_assignee = asset.assigned_to
-            
-            # Update asset
-            asset.assigned_to = employee
-            asset.assigned_date = timezone.now().date()
-            asset.status = 'assigned'
-            asset.save()
-            
-            # Create history record
-            AssetHistory.objects.create(
-                asset=asset,
-                action='assigned',
-                description=f'Asset assigned to {employee.full_name}',
-                performed_by=request.user,
-                old_value=str(old_assignee) if old_assignee else 'None',
-                new_value=employee.full_name
+            employee = get_object_or_404(
+                Employee.objects.only('employee_id', 'first_name', 'last_name', 'email'),
+                pk=employee_id
             )
+            old_assignee = asset.assigned_to
             
-            # Send email notification
-            if send_email and employee.email:
-                try:
-                    send_assignment_email(asset, employee, request.user)
-                    messages.success(request, f'Asset assigned and email sent to {employee.email}')
-                except Exception as e:
-                    messages.warning(request, f'Asset assigned but email failed: {str(e)}')
-            else:
-                messages.success(request, f'Asset {asset.asset_tag} assigned to {employee.full_name}')
+            with transaction.atomic():
+                # Update asset
+                asset.assigned_to = employee
+                asset.assigned_date = timezone.now().date()
+                asset.status = 'assigned'
+                asset.save(update_fields=['assigned_to', 'assigned_date', 'status', 'updated_at'])
+                
+                # Create history record
+                AssetHistory.objects.create(
+                    asset=asset,
+                    action='assigned',
+                    description=f'Asset assigned to {employee.full_name}',
+                    performed_by=request.user,
+                    old_value=str(old_assignee) if old_assignee else 'None',
+                    new_value=employee.full_name
+                )
+                
+                # Email notification
+                if send_email and employee.email:
+                    notify_on_commit(
+                        request, send_assignment_email_task,
+                        (asset.id, employee.id, request.user.id),
+                        f'Asset assigned and email {EMAIL_STATUS} ({employee.email})',
+                        'Asset assigned but email failed',
+                    )
+                else:
+                    messages.success(request, f'Asset {asset.asset_tag} assigned to {employee.full_name}')
             
             return redirect('assets:asset_detail', pk=pk)
     
-    employees = Employee.objects.filter(is_active=True).order_by('first_name')
+    employees = Employee.objects.filter(is_active=True).select_related(
+        'department'
+    ).only('first_name', 'last_name', 'department__name').order_by('first_name', 'last_name')
     
     context = {
         'asset': asset,
@@ -237,38 +446,40 @@ def assign_asset(request, pk):
 
 @login_required
 def unassign_asset(request, pk):
-    asset = get_object_or_404(Asset, pk=pk)
+    asset = get_object_or_404(Asset.objects.select_related('assigned_to'), pk=pk)
     
     if request.method == 'POST':
         old_assignee = asset.assigned_to
         send_email = request.POST.get('send_email', False)
         
         if old_assignee:
-            # Update asset
-            asset.assigned_to = None
-            asset.assigned_date = None
-            asset.status = 'available'
-            asset.save()
-            
-            # Create history record
-            AssetHistory.objects.create(
-                asset=asset,
-                action='unassigned',
-                description=f'Asset unassigned from {old_assignee.full_name}',
-                performed_by=request.user,
-                old_value=old_assignee.full_name,
-                new_value='None'
-            )
-            
-            # Send email notification
-            if send_email and old_assignee.email:
-                try:
-                    send_unassignment_email(asset, old_assignee, request.user)
-                    messages.success(request, f'Asset unassigned and email sent')
-                except Exception as e:
-                    messages.warning(request, f'Asset unassigned but email failed: {str(e)}')
-            else:
-                messages.success(request, f'Asset {asset.asset_tag} has been unassigned')
+            with transaction.atomic():
+                # Update asset
+                asset.assigned_to = None
+                asset.assigned_date = None
+                asset.status = 'available'
+                asset.save(update_fields=['assigned_to', 'assigned_date', 'status', 'updated_at'])
+                
+                # Create history record
+                AssetHistory.objects.create(
+                    asset=asset,
+                    action='unassigned',
+                    description=f'Asset unassigned from {old_assignee.full_name}',
+                    performed_by=request.user,
+                    old_value=old_assignee.full_name,
+                    new_value='None'
+                )
+                
+                # Email notification
+                if send_email and old_assignee.email:
+                    notify_on_commit(
+                        request, send_unassignment_email_task,
+                        (asset.id, old_assignee.id, request.user.id),
+                        f'Asset unassigned and email {EMAIL_STATUS}',
+                        'Asset unassigned but email failed',
+                    )
+                else:
+                    messages.success(request, f'Asset {asset.asset_tag} has been unassigned')
         
         return redirect('assets:asset_detail', pk=pk)
     
@@ -282,78 +493,76 @@ def unassign_asset(request, pk):
 # QR CODE GENERATION
 # ============================================
 
-@login_required
-def generate_qr_code(request, pk):
-    """Generate QR code for an asset"""
-    try:
-        import qrcode
-        from io import BytesIO
-    except ImportError:
-        messages.error(request, 'qrcode library not installed')
-        return redirect('assets:asset_detail', pk=pk)
-    
-    asset = get_object_or_404(Asset, pk=pk)
+QR_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def make_qr_png(data, error='m'):
+    """Render a QR code as PNG bytes, cached by its payload"""
+    key = f'qr:{error}:{hashlib.md5(data.encode()).hexdigest()}'
+    png = cache.get(key)
+    if png is None:
+        qr = segno.make(data, error=error, micro=False)
+        
+        # segno writes PNG natively, without going through Pillow
+        buffer = BytesIO()
+        qr.save(buffer, kind='png', scale=10, border=4)
+        png = buffer.getvalue()
+        cache.set(key, png, QR_CACHE_TIMEOUT)
     
-    # Create QR code data
-    qr_data = f"""Asset Tag: {asset.asset_tag}
+    return png
+
+
+def asset_label_qr_data(request, asset):
+    """QR payload printed on asset labels"""
+    return f"""Asset Tag: {asset.asset_tag}
 Name: {asset.name}
 Category: {asset.category.name if asset.category else 'N/A'}
 Serial: {asset.serial_number or 'N/A'}
 Status: {asset.get_status_display()}
-URL: {request.build_absolute_uri(f'/app/assets/{pk}/')}"""
-    
-    # Generate QR code
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(qr_data)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
+URL: {request.build_absolute_uri(f'/app/assets/{asset.pk}/')}"""
+
+
+def qr_data_uri(png):
+    """Inline a PNG for use directly in an <img> src"""
+    return 'data:image/png;base64,' + base64.b64encode(png).decode('ascii')
+
+
+def qr_response(png, disposition):
+    """PNG response that browsers may reuse until the QR content changes"""
+    response = HttpResponse(png, content_type='image/png')
+    response['Content-Disposition'] = disposition
+    response['Cache-Control'] = f'private, max-age={QR_CACHE_TIMEOUT}'
+    response['ETag'] = f'"{hashlib.md5(png).hexdigest()}"'
+    return response
+
+
+@login_required
+def generate_qr_code(request, pk):
+    """Generate QR code for an asset"""
+    if segno is None:
+        messages.error(request, 'segno library not installed')
+        return redirect('assets:asset_detail', pk=pk)
     
-    # Save to response
-    buffer = BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
+    asset = get_object_or_404(Asset.objects.select_related('category'), pk=pk)
     
-    response = HttpResponse(buffer.read(), content_type='image/png')
-    response['Content-Disposition'] = f'inline; filename="qr_{asset.asset_tag}.png"'
+    png = make_qr_png(asset_label_qr_data(request, asset), 'l')
     
-    return response
+    return qr_response(png, f'inline; filename="qr_{asset.asset_tag}.png"')
 
 
 @login_required
 def download_qr_code(request, pk):
     """Download QR code as file"""
-    try:
-        import qrcode
-        from io import BytesIO
-    except ImportError:
-        messages.error(request, 'qrcode library not installed')
+    if segno is None:
+        messages.error(request, 'segno library not installed')
         return redirect('assets:asset_detail', pk=pk)
     
     asset = get_object_or_404(Asset, pk=pk)
     
     # QR data with URL
-    qr_data = request.build_absolute_uri(f'/app/assets/{pk}/')
-    
-    qr = qrcode.QRCode(version=1, box_size=10, border=4)
-    qr.add_data(qr_data)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    
-    buffer = BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
-    
-    response = HttpResponse(buffer.read(), content_type='image/png')
-    response['Content-Disposition'] = f'attachment; filename="qr_{asset.asset_tag}.png"'
+    png = make_qr_png(request.build_absolute_uri(f'/app/assets/{pk}/'))
     
-    return response
+    return qr_response(png, f'attachment; filename="qr_{asset.asset_tag}.png"')
 
 
 @login_required
@@ -373,7 +582,17 @@ def bulk_print_labels(request):
     """Print multiple asset labels"""
     if request.method == 'POST':
         asset_ids = request.POST.getlist('asset_ids')
-        assets = Asset.objects.filter(id__in=asset_ids)
+        assets = list(Asset.objects.filter(id__in=asset_ids).select_related('category').only(
+            'asset_tag', 'name', 'category__name', 'serial_number', 'status',
+            'manufacturer', 'model'
+        ))
+        
+        # Embed the QR images in the page instead of one image request per label
+        if segno is not None:
+            for asset in assets:
+                asset.qr_data_uri = qr_data_uri(
+                    make_qr_png(asset_label_qr_data(request, asset), 'l')
+                )
         
         context = {
             'assets': assets,
@@ -391,6 +610,48 @@ def bulk_print_labels(request):
 # BULK IMPORT
 # ============================================
 
+# Optional text columns in the asset import sheet and their defaults
+ASSET_IMPORT_TEXT_DEFAULTS = {
+    'description': '',
+    'manufacturer': '',
+    'model': '',
+    'serial_number': None,
+    'notes': '',
+}
+
+
+ASSET_IMPORT_COLUMNS = [
+    'asset_tag', 'name', 'description', 'category', 'manufacturer',
+    'model', 'serial_number', 'status', 'condition', 'location',
+    'vendor', 'purchase_cost', 'notes'
+]
+
+ASSET_IMPORT_CLEAN_EXCLUDE = ['category', 'location', 'vendor', 'assigned_to', 'created_by']
+
+EMPLOYEE_IMPORT_COLUMNS = [
+    'employee_id', 'first_name', 'last_name', 'email', 'phone', 'department', 'position'
+]
+
+
+def read_import_sheet(file, columns):
+    """Read an uploaded Excel sheet, keeping only the columns the import understands"""
+    # calamine parses both .xlsx and .xls far faster than openpyxl/xlrd
+    engine = 'calamine' if python_calamine is not None else None
+    
+    return pd.read_excel(file, engine=engine, usecols=lambda col: col in columns)
+
+
+def resolve_names(model, names):
+    """Map names to ids for a lookup model, creating any that are missing"""
+    names = set(names)
+    existing = dict(model.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = names - existing.keys()
+    if missing:
+        model.objects.bulk_create([model(name=name) for name in missing], ignore_conflicts=True)
+        existing = dict(model.objects.filter(name__in=names).values_list('name', 'id'))
+    return existing
+
+
 @login_required
 def bulk_import(request):
     """Bulk import assets from Excel"""
@@ -405,11 +666,13 @@ def bulk_import(request):
             messages.error(request, 'Please upload an Excel file (.xlsx or .xls)')
             return redirect('assets:bulk_import')
         
+        if pd is None:
+            messages.error(request, 'pandas not installed')
+            return redirect('assets:bulk_import')
+        
         try:
-            import pandas as pd
-            
             # Read Excel file
-            df = pd.read_excel(file)
+            df = read_import_sheet(file, ASSET_IMPORT_COLUMNS)
             
             # Required columns
             required_cols = ['asset_tag', 'name']
@@ -418,67 +681,114 @@ def bulk_import(request):
                     messages.error(request, f'Missing required column: {col}')
                     return redirect('assets:bulk_import')
             
-            success_count = 0
-            error_count = 0
-            errors = []
+            # Add any optional columns the sheet left out
+            for col in ['category', 'location', 'vendor', 'status', 'condition', 'purchase_cost',
+                        *ASSET_IMPORT_TEXT_DEFAULTS]:
+                if col not in df.columns:
+                    df[col] = None
             
-            for index, row in df.iterrows():
-                try:
-                    # Get or create category
-                    category = None
-                    if 'category' in df.columns and pd.notna(row.get('category')):
-                        category, _ = Category.objects.get_or_create(
-                            name=str(row['category']).strip()
-                        )
-                    
-                    # Get or create location
-                    location = None
-                    if 'location' in df.columns and pd.notna(row.get('location')):
-                        location, _ = Location.objects.get_or_create(
-                            name=str(row['location']).strip()
-                        )
-                    
-                    # Get or create vendor
-                    vendor = None
-                    if 'vendor' in df.columns and pd.notna(row.get('vendor')):
-                        vendor, _ = Vendor.objects.get_or_create(
-                            name=str(row['vendor']).strip()
-                        )
-                    
-                    # Create asset
-                    asset, created = Asset.objects.update_or_create(
-                        asset_tag=str(row['asset_tag']).strip(),
-                        defaults={
-                            'name': str(row['name']).strip(),
-                            'description': str(row.get('description', '')).strip() if pd.notna(row.get('description')) else '',
-                            'category': category,
-                            'manufacturer': str(row.get('manufacturer', '')).strip() if pd.notna(row.get('manufacturer')) else '',
-                            'model': str(row.get('model', '')).strip() if pd.notna(row.get('model')) else '',
-                            'serial_number': str(row.get('serial_number', '')).strip() if pd.notna(row.get('serial_number')) else None,
-                            'status': str(row.get('status', 'available')).strip().lower() if pd.notna(row.get('status')) else 'available',
-                            'condition': str(row.get('condition', 'new')).strip().lower() if pd.notna(row.get('condition')) else 'new',
-                            'location': location,
-                            'vendor': vendor,
-                            'purchase_cost': float(row['purchase_cost']) if 'purchase_cost' in df.columns and pd.notna(row.get('purchase_cost')) else None,
-                            'notes': str(row.get('notes', '')).strip() if pd.notna(row.get('notes')) else '',
-                            'created_by': request.user,
-                        }
+            # Clean whole columns at once instead of cell by cell
+            for col in ['asset_tag', 'name', 'category', 'location', 'vendor', 'status', 'condition',
+                        *ASSET_IMPORT_TEXT_DEFAULTS]:
+                df[col] = df[col].astype('string').str.strip()
+            
+            missing = df[required_cols].isna().any(axis=1)
+            cost = pd.to_numeric(df['purchase_cost'], errors='coerce')
+            bad_cost = df['purchase_cost'].notna() & cost.isna()
+            df['purchase_cost'] = cost
+            
+            invalid = missing | bad_cost
+            errors = [
+                f"Row {index + 2}: "
+                + ('asset_tag and name are required' if missing[index] else 'invalid purchase_cost')
+                for index in df.index[invalid]
+            ]
+            
+            df = df[~invalid]
+            
+            for col, default in ASSET_IMPORT_TEXT_DEFAULTS.items():
+                if default is not None:
+                    df[col] = df[col].fillna(default)
+            df['status'] = df['status'].fillna('available').str.lower()
+            df['condition'] = df['condition'].fillna('new').str.lower()
+            
+            # One transaction for the whole import instead of a commit per statement
+            with transaction.atomic():
+                # Resolve category/location/vendor names with one lookup per table
+                for col, model in [('category', Category), ('location', Location), ('vendor', Vendor)]:
+                    name_map = resolve_names(model, df[col].dropna())
+                    df[f'{col}_id'] = df[col].map(name_map).astype('Int64')
+                
+                df = df.astype(object).where(df.notna(), None)
+                
+                existing = dict(Asset.objects.filter(
+                    asset_tag__in=df['asset_tag'].tolist()
+                ).values_list('asset_tag', 'id'))
+                now = timezone.now()
+                valid = {}
+                
+                for row in df.itertuples():
+                    asset = Asset(
+                        id=existing.get(row.asset_tag),
+                        asset_tag=row.asset_tag,
+                        name=row.name,
+                        description=row.description,
+                        category_id=row.category_id,
+                        manufacturer=row.manufacturer,
+                        model=row.model,
+                        serial_number=row.serial_number,
+                        status=row.status,
+                        condition=row.condition,
+                        location_id=row.location_id,
+                        vendor_id=row.vendor_id,
+                        purchase_cost=row.purchase_cost,
+                        notes=row.notes,
+                        created_by=request.user,
+                        updated_at=now,
                     )
                     
-                    if created:
-                        # Create history
-                        AssetHistory.objects.create(
-                            asset=asset,
-                            action='created',
-                            description=f'Asset imported via bulk upload',
-                            performed_by=request.user
-                        )
+                    # Catch what the column checks miss (max_digits, max_length, choices)
+                    # so one bad row is skipped instead of failing the bulk write.
+                    # Foreign keys come from resolve_names, so skip their per-row lookups.
+                    try:
+                        asset.clean_fields(exclude=ASSET_IMPORT_CLEAN_EXCLUDE)
+                    except ValidationError as e:
+                        errors.append(f"Row {row.Index + 2}: {'; '.join(e.messages)}")
+                        continue
                     
-                    success_count += 1
-                    
-                except Exception as e:
-                    error_count += 1
-                    errors.append(f"Row {index + 2}: {str(e)}")
+                    # Deduplicate only after validation: the last valid row for a tag
+                    # wins, so a bad repeat does not discard an earlier good row
+                    valid[asset.asset_tag] = asset
+                
+                to_create = [asset for asset in valid.values() if not asset.id]
+                to_update = [asset for asset in valid.values() if asset.id]
+                
+                Asset.objects.bulk_update(to_update, [
+                    'name', 'description', 'category', 'manufacturer', 'model', 'serial_number',
+                    'status', 'condition', 'location', 'vendor', 'purchase_cost', 'notes',
+                    'created_by', 'updated_at',
+                ], batch_size=500)
+                Asset.objects.bulk_create(to_create, batch_size=500)
+                
+                # bulk_create does not return ids on every backend, so look them up
+                created_ids = Asset.objects.filter(
+                    asset_tag__in=[asset.asset_tag for asset in to_create]
+                ).values_list('id', flat=True)
+                AssetHistory.objects.bulk_create([
+                    AssetHistory(
+                        asset_id=asset_id,
+                        action='created',
+                        description=f'Asset imported via bulk upload',
+                        performed_by=request.user
+                    )
+                    for asset_id in created_ids
+                ], batch_size=500)
+            
+            # Bulk writes skip model signals, so drop cached dashboard and report data here
+            cache.delete_many([DASHBOARD_CACHE_KEY, reports_cache_key(timezone.now().date())])
+            
+            success_count = len(to_create) + len(to_update)
+            error_count = len(errors)
             
             if success_count > 0:
                 messages.success(request, f'Successfully imported {success_count} assets')
@@ -500,35 +810,21 @@ def bulk_import(request):
 @login_required
 def download_import_template(request):
     """Download Excel template for bulk import"""
-    try:
-        import xlsxwriter
-        from io import BytesIO
-    except ImportError:
+    if xlsxwriter is None:
         messages.error(request, 'xlsxwriter not installed')
         return redirect('assets:bulk_import')
     
     output = BytesIO()
-    workbook = xlsxwriter.Workbook(output)
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
     worksheet = workbook.add_worksheet('Assets')
     
-    # Header format
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#4f46e5',
-        'font_color': 'white',
-        'border': 1,
-    })
+    header_format = workbook.add_format(EXCEL_HEADER_FORMAT)
     
     # Headers
-    headers = [
-        'asset_tag', 'name', 'description', 'category', 'manufacturer',
-        'model', 'serial_number', 'status', 'condition', 'location',
-        'vendor', 'purchase_cost', 'notes'
-    ]
+    headers = ASSET_IMPORT_COLUMNS
     
-    for col, header in enumerate(headers):
-        worksheet.write(0, col, header, header_format)
-        worksheet.set_column(col, col, 15)
+    worksheet.set_column(0, len(headers) - 1, 15)
+    worksheet.write_row(0, 0, headers, header_format)
     
     # Sample data
     sample_data = [
@@ -537,8 +833,7 @@ def download_import_template(request):
         'Dell Technologies', '75000', 'Sample asset'
     ]
     
-    for col, value in enumerate(sample_data):
-        worksheet.write(1, col, value)
+    worksheet.write_row(1, 0, sample_data)
     
     # Add notes
     worksheet.write(3, 0, 'Notes:')
@@ -547,15 +842,8 @@ def download_import_template(request):
     worksheet.write(6, 0, '- condition: new, good, fair, poor')
     
     workbook.close()
-    output.seek(0)
-    
-    response = HttpResponse(
-        output.read(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = 'attachment; filename="asset_import_template.xlsx"'
     
-    return response
+    return file_download(output, 'asset_import_template.xlsx', XLSX_CONTENT_TYPE)
 
 
 @login_required
@@ -568,10 +856,12 @@ def bulk_import_employees(request):
         
         file = request.FILES['file']
         
+        if pd is None:
+            messages.error(request, 'pandas not installed')
+            return redirect('assets:bulk_import_employees')
+        
         try:
-            import pandas as pd
-            
-            df = pd.read_excel(file)
+            df = read_import_sheet(file, EMPLOYEE_IMPORT_COLUMNS)
             
             required_cols = ['employee_id', 'first_name', 'last_name', 'email']
             for col in required_cols:
@@ -579,32 +869,47 @@ def bulk_import_employees(request):
                     messages.error(request, f'Missing required column: {col}')
                     return redirect('assets:bulk_import_employees')
             
+            for col in ['phone', 'department', 'position']:
+                if col not in df.columns:
+                    df[col] = None
+            
+            # Clean whole columns at once instead of cell by cell
+            for col in EMPLOYEE_IMPORT_COLUMNS:
+                df[col] = df[col].astype('string').str.strip()
+            
+            df[['phone', 'position']] = df[['phone', 'position']].fillna('')
+            
+            missing = df[required_cols].isna().any(axis=1)
+            error_count = int(missing.sum())
+            df = df[~missing].astype(object)
+            df = df.where(df.notna(), None)
+            
             success_count = 0
-            error_count = 0
             
-            for index, row in df.iterrows():
-                try:
-                    department = None
-                    if 'department' in df.columns and pd.notna(row.get('department')):
-                        department, _ = Department.objects.get_or_create(
-                            name=str(row['department']).strip()
-                        )
-                    
-                    Employee.objects.update_or_create(
-                        employee_id=str(row['employee_id']).strip(),
-                        defaults={
-                            'first_name': str(row['first_name']).strip(),
-                            'last_name': str(row['last_name']).strip(),
-                            'email': str(row['email']).strip(),
-                            'phone': str(row.get('phone', '')).strip() if pd.notna(row.get('phone')) else '',
-                            'department': department,
-                            'position': str(row.get('position', '')).strip() if pd.notna(row.get('position')) else '',
-                            'is_active': True,
-                        }
-                    )
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
+            # One commit for the whole file; each row gets a savepoint so a bad
+            # row is rolled back on its own without aborting the transaction
+            with transaction.atomic():
+                # Resolve every department name up front rather than once per row
+                department_ids = resolve_names(Department, df['department'].dropna())
+                
+                for row in df.itertuples(index=False):
+                    try:
+                        with transaction.atomic():
+                            Employee.objects.update_or_create(
+                                employee_id=row.employee_id,
+                                defaults={
+                                    'first_name': row.first_name,
+                                    'last_name': row.last_name,
+                                    'email': row.email,
+                                    'phone': row.phone,
+                                    'department_id': department_ids.get(row.department),
+                                    'position': row.position,
+                                    'is_active': True,
+                                }
+                            )
+                        success_count += 1
+                    except Exception as e:
+                        error_count += 1
             
             messages.success(request, f'Imported {success_count} employees, {error_count} errors')
             return redirect('assets:employee_list')
@@ -621,9 +926,7 @@ def bulk_import_employees(request):
 
 @login_required
 def employee_list(request):
-    employees = Employee.objects.select_related('department').annotate(
-        asset_count=Count('assets')
-    ).all()
+    employees = Employee.objects.all()
     
     search = request.GET.get('search', '')
     if search:
@@ -646,31 +949,38 @@ def employee_list(request):
     
     departments = Department.objects.all()
     
+    # Count the filtered rows without the department join and asset-count GROUP BY
+    pagination = paginate(
+        request,
+        employees.select_related('department').annotate(
+            asset_count=Count('assets')
+        ).order_by('first_name', 'last_name'),
+        filters_applied=any([search, department, status]),
+        count_queryset=employees,
+    )
+    
     context = {
-        'employees': employees,
+        'employees': pagination['page_obj'],
         'departments': departments,
         'search': search,
         'selected_department': department,
         'selected_status': status,
-        'total_count': employees.count(),
+        'total_count': pagination['paginator'].count,
+        **pagination,
     }
     return render(request, 'assets/employee_list.html', context)
 
 
 @login_required
 def employee_detail(request, pk):
-    employee = get_object_or_404(Employee, pk=pk)
-    assigned_assets = employee.assets.all()
-    
-    asset_history = AssetHistory.objects.filter(
-        Q(new_value__icontains=employee.full_name) |
-        Q(old_value__icontains=employee.full_name)
-    ).order_by('-created_at')[:10]
+    employee = get_object_or_404(Employee.objects.select_related('department'), pk=pk)
+    assigned_assets = employee.assets.select_related('category').only(
+        'asset_tag', 'name', 'assigned_to', 'assigned_date', 'category__name', 'category__icon'
+    )
     
     context = {
         'employee': employee,
         'assigned_assets': assigned_assets,
-        'asset_history': asset_history,
     }
     return render(request, 'assets/employee_detail.html', context)
 
@@ -679,17 +989,57 @@ def employee_detail(request, pk):
 # PDF REPORTS
 # ============================================
 
+# Styles are immutable once built, so every report shares one copy
+if reportlab is not None:
+    PDF_STYLES = getSampleStyleSheet()
+    
+    PDF_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=PDF_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor('#4f46e5')
+    )
+    
+    PDF_FOOTER_STYLE = ParagraphStyle('Footer', parent=PDF_STYLES['Normal'], fontSize=8, textColor=colors.grey)
+    
+    ASSET_DETAIL_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ])
+    
+    ASSET_HISTORY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ])
+    
+    ALL_ASSETS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+    ])
+
+
 @login_required
 def generate_asset_pdf(request, pk):
     """Generate PDF report for single asset"""
-    try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from io import BytesIO
-    except ImportError:
+    if reportlab is None:
         messages.error(request, 'reportlab not installed. Run: pip install reportlab')
         return redirect('assets:asset_detail', pk=pk)
     
@@ -699,17 +1049,9 @@ def generate_asset_pdf(request, pk):
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
     
     elements = []
-    styles = getSampleStyleSheet()
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=colors.HexColor('#4f46e5')
-    )
-    elements.append(Paragraph("Asset Report", title_style))
+    elements.append(Paragraph("Asset Report", PDF_TITLE_STYLE))
     elements.append(Spacer(1, 20))
     
     # Asset details table
@@ -730,21 +1072,12 @@ def generate_asset_pdf(request, pk):
     ]
     
     table = Table(data, colWidths=[2*inch, 4*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f1f5f9')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-    ]))
+    table.setStyle(ASSET_DETAIL_TABLE_STYLE)
     elements.append(table)
     
     # History section
     elements.append(Spacer(1, 30))
-    elements.append(Paragraph("Asset History", styles['Heading2']))
+    elements.append(Paragraph("Asset History", PDF_STYLES['Heading2']))
     elements.append(Spacer(1, 10))
     
     history = asset.history.all()[:10]
@@ -759,58 +1092,42 @@ def generate_asset_pdf(request, pk):
             ])
         
         history_table = Table(history_data, colWidths=[1.2*inch, 1*inch, 2.5*inch, 1*inch])
-        history_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ]))
+        history_table.setStyle(ASSET_HISTORY_TABLE_STYLE)
         elements.append(history_table)
     
     # Footer
     elements.append(Spacer(1, 30))
-    footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey)
-    elements.append(Paragraph(f"Generated on {timezone.now().strftime('%Y-%m-%d %H:%M:%S')} by {request.user.username}", footer_style))
+    elements.append(Paragraph(f"Generated on {timezone.now().strftime('%Y-%m-%d %H:%M:%S')} by {request.user.username}", PDF_FOOTER_STYLE))
     
     doc.build(elements)
     
-    buffer.seek(0)
-    response = HttpResponse(buffer.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="asset_{asset.asset_tag}_report.pdf"'
-    
-    return response
+    return file_download(buffer, f'asset_{asset.asset_tag}_report.pdf', 'application/pdf')
 
 
 @login_required
 def generate_all_assets_pdf(request):
     """Generate PDF report for all assets"""
-    try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4, landscape
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib.units import inch
-        from io import BytesIO
-    except ImportError:
+    if reportlab is None:
         messages.error(request, 'reportlab not installed')
         return redirect('assets:reports')
     
-    buffer = BytesIO()
+    # Large reports spill to disk instead of being held in memory
+    buffer = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
     doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
     
     elements = []
-    styles = getSampleStyleSheet()
     
     # Title
-    elements.append(Paragraph("All Assets Report", styles['Heading1']))
-    elements.append(Paragraph(f"Generated: {timezone.now().strftime('%Y-%m-%d %H:%M')}", styles['Normal']))
+    elements.append(Paragraph("All Assets Report", PDF_STYLES['Heading1']))
+    elements.append(Paragraph(f"Generated: {timezone.now().strftime('%Y-%m-%d %H:%M')}", PDF_STYLES['Normal']))
     elements.append(Spacer(1, 20))
     
     # Assets table
-    assets = Asset.objects.select_related('category', 'assigned_to', 'location').all()
+    assets = Asset.objects.select_related('category', 'assigned_to', 'location').only(
+        'asset_tag', 'name', 'category__name', 'status', 'condition',
+        'assigned_to__first_name', 'assigned_to__last_name',
+        'location__name', 'location__building', 'location__floor', 'purchase_cost'
+    ).iterator(chunk_size=2000)
     
     data = [['Asset Tag', 'Name', 'Category', 'Status', 'Condition', 'Assigned To', 'Location', 'Cost']]
     
@@ -826,26 +1143,15 @@ def generate_all_assets_pdf(request):
             f'₹{asset.purchase_cost}' if asset.purchase_cost else '-',
         ])
     
-    table = Table(data, repeatRows=1)
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
-    ]))
+    # LongTable sizes columns from the first rows only instead of every row
+    table = LongTable(data, repeatRows=1)
+    table.setStyle(ALL_ASSETS_TABLE_STYLE)
     elements.append(table)
     
     doc.build(elements)
     
-    buffer.seek(0)
-    response = HttpResponse(buffer.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="all_assets_report_{timezone.now().strftime("%Y%m%d")}.pdf"'
-    
-    return response
+    filename = f'all_assets_report_{timezone.now().strftime("%Y%m%d")}.pdf'
+    return file_download(buffer, filename, 'application/pdf')
 
 
 # ============================================
@@ -855,29 +1161,20 @@ def generate_all_assets_pdf(request):
 @login_required
 def export_assets(request):
     """Export assets to Excel"""
-    try:
-        import xlsxwriter
-        from io import BytesIO
-    except ImportError:
+    if xlsxwriter is None:
         messages.error(request, 'xlsxwriter not installed')
         return redirect('assets:asset_list')
     
-    output = BytesIO()
-    workbook = xlsxwriter.Workbook(output)
+    # Large workbooks spill to disk instead of being held in memory
+    output = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+    # constant_memory flushes each row as it is written; rows must go in order
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
     worksheet = workbook.add_worksheet('Assets')
     
     # Styles
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#4f46e5',
-        'font_color': 'white',
-        'border': 1,
-        'align': 'center',
-    })
-    
-    cell_format = workbook.add_format({'border': 1, 'align': 'left'})
-    money_format = workbook.add_format({'border': 1, 'num_format': '₹#,##0.00'})
-    date_format = workbook.add_format({'border': 1, 'num_format': 'yyyy-mm-dd'})
+    header_format = workbook.add_format(EXCEL_HEADER_FORMAT)
+    cell_format = workbook.add_format(EXCEL_CELL_FORMAT)
+    money_format = workbook.add_format({**EXCEL_CELL_FORMAT, 'num_format': '₹#,##0.00'})
     
     headers = [
         'Asset Tag', 'Name', 'Category', 'Status', 'Condition',
@@ -886,189 +1183,106 @@ def export_assets(request):
         'Purchase Cost', 'Warranty Expiry', 'Notes'
     ]
     
-    for col, header in enumerate(headers):
-        worksheet.write(0, col, header, header_format)
-        worksheet.set_column(col, col, 15)
+    worksheet.set_column(0, len(headers) - 1, 15)
+    worksheet.write_row(0, 0, headers, header_format)
     
-    assets = Asset.objects.select_related('category', 'location', 'assigned_to', 'vendor').all()
+    assets = Asset.objects.select_related(
+        'category', 'location', 'assigned_to', 'vendor'
+    ).only(
+        'asset_tag', 'name', 'category__name', 'status', 'condition',
+        'manufacturer', 'model', 'serial_number',
+        'location__name', 'location__building', 'location__floor',
+        'assigned_to__first_name', 'assigned_to__last_name', 'assigned_date',
+        'vendor__name', 'purchase_date', 'purchase_cost', 'warranty_expiry', 'notes'
+    ).iterator(chunk_size=2000)
     
     for row, asset in enumerate(assets, start=1):
-        worksheet.write(row, 0, asset.asset_tag, cell_format)
-        worksheet.write(row, 1, asset.name, cell_format)
-        worksheet.write(row, 2, asset.category.name if asset.category else '', cell_format)
-        worksheet.write(row, 3, asset.get_status_display(), cell_format)
-        worksheet.write(row, 4, asset.get_condition_display(), cell_format)
-        worksheet.write(row, 5, asset.manufacturer or '', cell_format)
-        worksheet.write(row, 6, asset.model or '', cell_format)
-        worksheet.write(row, 7, asset.serial_number or '', cell_format)
-        worksheet.write(row, 8, str(asset.location) if asset.location else '', cell_format)
-        worksheet.write(row, 9, asset.assigned_to.full_name if asset.assigned_to else '', cell_format)
-        worksheet.write(row, 10, str(asset.assigned_date) if asset.assigned_date else '', date_format)
-        worksheet.write(row, 11, asset.vendor.name if asset.vendor else '', cell_format)
-        worksheet.write(row, 12, str(asset.purchase_date) if asset.purchase_date else '', date_format)
-        worksheet.write(row, 13, float(asset.purchase_cost) if asset.purchase_cost else 0, money_format)
-        worksheet.write(row, 14, str(asset.warranty_expiry) if asset.warranty_expiry else '', date_format)
-        worksheet.write(row, 15, asset.notes or '', cell_format)
+        worksheet.write_row(row, 0, [
+            asset.asset_tag,
+            asset.name,
+            asset.category.name if asset.category else '',
+            asset.get_status_display(),
+            asset.get_condition_display(),
+            asset.manufacturer or '',
+            asset.model or '',
+            asset.serial_number or '',
+            str(asset.location) if asset.location else '',
+            asset.assigned_to.full_name if asset.assigned_to else '',
+            str(asset.assigned_date) if asset.assigned_date else '',
+            asset.vendor.name if asset.vendor else '',
+            str(asset.purchase_date) if asset.purchase_date else '',
+        ], cell_format)
+        worksheet.write_number(row, 13, float(asset.purchase_cost) if asset.purchase_cost else 0, money_format)
+        worksheet.write_row(row, 14, [
+            str(asset.warranty_expiry) if asset.warranty_expiry else '',
+            asset.notes or '',
+        ], cell_format)
     
     workbook.close()
-    output.seek(0)
     
     filename = f'assets_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-    response = HttpResponse(output.read(), content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
+    return file_download(output, filename, XLSX_CONTENT_TYPE)
 
 
 @login_required
 def export_employees(request):
     """Export employees to Excel"""
-    try:
-        import xlsxwriter
-        from io import BytesIO
-    except ImportError:
+    if xlsxwriter is None:
         messages.error(request, 'xlsxwriter not installed')
         return redirect('assets:employee_list')
     
     output = BytesIO()
-    workbook = xlsxwriter.Workbook(output)
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
     worksheet = workbook.add_worksheet('Employees')
     
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#4f46e5',
-        'font_color': 'white',
-        'border': 1,
-    })
-    
-    cell_format = workbook.add_format({'border': 1})
+    header_format = workbook.add_format(EXCEL_HEADER_FORMAT)
+    cell_format = workbook.add_format(EXCEL_CELL_FORMAT)
     
     headers = ['Employee ID', 'First Name', 'Last Name', 'Email', 'Phone', 
                'Department', 'Position', 'Status', 'Hire Date', 'Assets Count']
     
-    for col, header in enumerate(headers):
-        worksheet.write(0, col, header, header_format)
-        worksheet.set_column(col, col, 15)
+    worksheet.set_column(0, len(headers) - 1, 15)
+    worksheet.write_row(0, 0, headers, header_format)
     
-    employees = Employee.objects.select_related('department').annotate(asset_count=Count('assets')).all()
+    employees = Employee.objects.select_related('department').annotate(
+        asset_count=Count('assets')
+    ).iterator(chunk_size=2000)
     
     for row, emp in enumerate(employees, start=1):
-        worksheet.write(row, 0, emp.employee_id, cell_format)
-        worksheet.write(row, 1, emp.first_name, cell_format)
-        worksheet.write(row, 2, emp.last_name, cell_format)
-        worksheet.write(row, 3, emp.email, cell_format)
-        worksheet.write(row, 4, emp.phone or '', cell_format)
-        worksheet.write(row, 5, emp.department.name if emp.department else '', cell_format)
-        worksheet.write(row, 6, emp.position or '', cell_format)
-        worksheet.write(row, 7, 'Active' if emp.is_active else 'Inactive', cell_format)
-        worksheet.write(row, 8, str(emp.hire_date) if emp.hire_date else '', cell_format)
-        worksheet.write(row, 9, emp.asset_count, cell_format)
+        worksheet.write_row(row, 0, [
+            emp.employee_id,
+            emp.first_name,
+            emp.last_name,
+            emp.email,
+            emp.phone or '',
+            emp.department.name if emp.department else '',
+            emp.position or '',
+            'Active' if emp.is_active else 'Inactive',
+            str(emp.hire_date) if emp.hire_date else '',
+            emp.asset_count,
+        ], cell_format)
     
     workbook.close()
-    output.seek(0)
     
     filename = f'employees_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-    response = HttpResponse(output.read(), content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
+    return file_download(output, filename, XLSX_CONTENT_TYPE)
 
 
 # ============================================
 # EMAIL NOTIFICATIONS
 # ============================================
 
-def send_assignment_email(asset, employee, assigned_by):
-    """Send email when asset is assigned"""
-    subject = f'Asset Assigned: {asset.asset_tag}'
-    
-    message = f"""
-Dear {employee.full_name},
-
-An IT asset has been assigned to you.
-
-Asset Details:
-- Asset Tag: {asset.asset_tag}
-- Name: {asset.name}
-- Category: {asset.category.name if asset.category else 'N/A'}
-- Serial Number: {asset.serial_number or 'N/A'}
-- Assigned Date: {asset.assigned_date}
-- Assigned By: {assigned_by.username}
-
-Please take good care of this equipment. If you have any questions, please contact the IT department.
-
-Best regards,
-IT Asset Management System
-"""
-    
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [employee.email],
-        fail_silently=False,
-    )
-
-
-def send_unassignment_email(asset, employee, unassigned_by):
-    """Send email when asset is unassigned"""
-    subject = f'Asset Returned: {asset.asset_tag}'
-    
-    message = f"""
-Dear {employee.full_name},
-
-The following IT asset has been unassigned from you:
-
-- Asset Tag: {asset.asset_tag}
-- Name: {asset.name}
-- Unassigned By: {unassigned_by.username}
-- Date: {timezone.now().strftime('%Y-%m-%d')}
-
-If you still have this asset, please return it to the IT department.
-
-Best regards,
-IT Asset Management System
-"""
-    
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [employee.email],
-        fail_silently=False,
-    )
-
-
 @login_required
 def send_warranty_alerts(request):
     """Send warranty expiry alerts"""
-    thirty_days = timezone.now().date() + timedelta(days=30)
-    
-    expiring_assets = Asset.objects.filter(
-        warranty_expiry__lte=thirty_days,
-        warranty_expiry__gte=timezone.now().date()
-    ).select_related('assigned_to')
-    
-    if not expiring_assets:
+    if not expiring_warranty_assets().exists():
         messages.info(request, 'No assets with expiring warranties')
         return redirect('assets:reports')
     
     # Send to admin
-    subject = f'Warranty Alert: {expiring_assets.count()} assets expiring soon'
-    
-    message = "The following assets have warranties expiring within 30 days:\n\n"
-    for asset in expiring_assets:
-        message += f"- {asset.asset_tag} - {asset.name} - Expires: {asset.warranty_expiry}\n"
-    
     try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [request.user.email],
-            fail_silently=False,
-        )
-        messages.success(request, f'Warranty alert sent to {request.user.email}')
+        send_warranty_alerts_task.delay(request.user.email)
+        messages.success(request, f'Warranty alert {EMAIL_STATUS} ({request.user.email})')
     except Exception as e:
         messages.error(request, f'Failed to send email: {str(e)}')
     
@@ -1079,46 +1293,127 @@ def send_warranty_alerts(request):
 # REPORTS
 # ============================================
 
-@login_required
-def reports(request):
-    total_assets = Asset.objects.count()
-    total_value = Asset.objects.aggregate(total=Sum('purchase_cost'))['total'] or 0
-    
-    status_counts = Asset.objects.values('status').annotate(count=Count('id'))
-    
-    category_counts = Category.objects.annotate(
-        count=Count('asset'),
-        total_value=Sum('asset__purchase_cost')
-    ).filter(count__gt=0)
+REPORTS_CACHE_TIMEOUT = 300
+
+
+def _report_breakdowns():
+    """Asset counts per category, location and department in one round trip"""
+    asset = Asset._meta.db_table
+    category = Category._meta.db_table
+    location = Location._meta.db_table
+    department = Department._meta.db_table
+    employee = Employee._meta.db_table
+    
+    # Each branch only returns dimensions that have assets, like filter(count__gt=0)
+    sql = f"""
+        SELECT 'category', c.id, c.name, c.icon, NULL, COUNT(a.id), SUM(a.purchase_cost)
+        FROM {category} c JOIN {asset} a ON a.category_id = c.id
+        GROUP BY c.id, c.name, c.icon
+        UNION ALL
+        SELECT 'location', l.id, l.name, l.building, l.floor, COUNT(a.id), NULL
+        FROM {location} l JOIN {asset} a ON a.location_id = l.id
+        GROUP BY l.id, l.name, l.building, l.floor
+        UNION ALL
+        SELECT 'department', d.id, d.name, NULL, NULL, COUNT(a.id), NULL
+        FROM {department} d
+        JOIN {employee} e ON e.department_id = d.id
+        JOIN {asset} a ON a.assigned_to_id = e.id
+        GROUP BY d.id, d.name
+        ORDER BY 1, 3
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+    
+    category_counts = []
+    location_counts = []
+    department_counts = []
+    for kind, pk, name, extra1, extra2, count, total_value in rows:
+        if kind == 'category':
+            category_counts.append({
+                'id': pk, 'name': name, 'icon': extra1, 'count': count, 'total_value': total_value,
+            })
+        elif kind == 'location':
+            location_counts.append({
+                'id': pk, 'name': name, 'building': extra1, 'floor': extra2, 'count': count,
+            })
+        else:
+            department_counts.append({'id': pk, 'name': name, 'asset_count': count})
     
-    location_counts = Location.objects.annotate(count=Count('asset')).filter(count__gt=0)
+    return category_counts, location_counts, department_counts
+
+
+def _compute_report_context(today):
+    """Compute the aggregates shown on the reports page"""
+    # Plain date bounds against the indexed DateField; see expiring_warranty_assets
+    thirty_days = today + timedelta(days=30)
     
-    department_counts = Department.objects.annotate(
-        asset_count=Count('employee__assets')
-    ).filter(asset_count__gt=0)
+    # Totals, status and warranty counts in one pass over the asset table
+    totals = Asset.objects.aggregate(
+        total_assets=Count('id'),
+        total_value=Sum('purchase_cost'),
+        warranty_valid=Count('id', filter=Q(warranty_expiry__gte=today)),
+        warranty_expiring=Count('id', filter=Q(warranty_expiry__range=(today, thirty_days))),
+        warranty_expired=Count('id', filter=Q(warranty_expiry__lt=today)),
+        **{
+            f'status_{value}': Count('id', filter=Q(status=value))
+            for value, _ in Asset.STATUS_CHOICES
+        },
+    )
     
-    today = timezone.now().date()
-    thirty_days = today + timedelta(days=30)
+    # Only statuses that are in use, as the old GROUP BY returned
+    status_counts = [
+        {'status': value, 'count': totals[f'status_{value}']}
+        for value, _ in Asset.STATUS_CHOICES
+        if totals[f'status_{value}']
+    ]
     
-    warranty_valid = Asset.objects.filter(warranty_expiry__gte=today).count()
-    warranty_expiring = Asset.objects.filter(
-        warranty_expiry__gte=today,
-        warranty_expiry__lte=thirty_days
-    ).count()
-    warranty_expired = Asset.objects.filter(warranty_expiry__lt=today).count()
+    category_counts, location_counts, department_counts = _report_breakdowns()
     
-    context = {
-        'total_assets': total_assets,
-        'total_value': total_value,
+    return {
+        'total_assets': totals['total_assets'],
+        'total_value': totals['total_value'] or 0,
         'status_counts': status_counts,
         'category_counts': category_counts,
         'location_counts': location_counts,
         'department_counts': department_counts,
-        'warranty_valid': warranty_valid,
-        'warranty_expiring': warranty_expiring,
-        'warranty_expired': warranty_expired,
+        'warranty_valid': totals['warranty_valid'],
+        'warranty_expiring': totals['warranty_expiring'],
+        'warranty_expired': totals['warranty_expired'],
     }
-    return render(request, 'assets/reports.html', context)
+
+
+def _cached_report_context():
+    today = timezone.now().date()
+    return cache.get_or_set(
+        reports_cache_key(today),
+        lambda: _compute_report_context(today),
+        REPORTS_CACHE_TIMEOUT
+    )
+
+
+def reports_etag(request):
+    """ETag for the reports page: changes whenever the report data or viewer does"""
+    # A 304 would swallow flash messages from the views that redirect here
+    if len(messages.get_messages(request)):
+        return None
+    
+    # The default LocMemCache is per process, so another worker may validate
+    # against report data up to REPORTS_CACHE_TIMEOUT old
+    context = _cached_report_context()
+    
+    # base.html renders these user fields in the header and navigation
+    user = request.user
+    viewer = (user.pk, user.username, user.get_full_name(), user.email, user.is_superuser)
+    
+    payload = repr((viewer, sorted(context.items())))
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+@login_required
+@etag(reports_etag)
+def reports(request):
+    return render(request, 'assets/reports.html', _cached_report_context())
 
 
 # ============================================
@@ -1127,7 +1422,10 @@ def reports(request):
 
 @login_required
 def maintenance_list(request):
-    records = MaintenanceRecord.objects.select_related('asset').all()
+    records = MaintenanceRecord.objects.select_related('asset').only(
+        'maintenance_type', 'status', 'scheduled_date', 'completed_date', 'cost',
+        'asset__asset_tag', 'asset__name'
+    ).order_by('-scheduled_date')
     
     status = request.GET.get('status', '')
     if status:
@@ -1137,17 +1435,23 @@ def maintenance_list(request):
     if mtype:
         records = records.filter(maintenance_type=mtype)
     
+    pagination = paginate(request, records, filters_applied=any([status, mtype]))
+    
     context = {
-        'records': records,
+        'records': pagination['page_obj'],
         'selected_status': status,
         'selected_type': mtype,
+        **pagination,
     }
     return render(request, 'assets/maintenance_list.html', context)
 
 
-@login_required
-def history_list(request):
-    history = AssetHistory.objects.select_related('asset', 'performed_by').all()
+def filter_history(request):
+    """History entries matching the action/search filters in the query string"""
+    history = AssetHistory.objects.select_related('asset', 'performed_by').only(
+        'action', 'description', 'created_at',
+        'asset__asset_tag', 'performed_by__username'
+    )
     
     action = request.GET.get('action', '')
     if action:
@@ -1161,32 +1465,99 @@ def history_list(request):
             Q(description__icontains=search)
         )
     
+    return history, action, search
+
+
+@login_required
+def history_list(request):
+    history, action, search = filter_history(request)
+    
+    pagination = paginate(
+        request, history.order_by('-created_at'), filters_applied=any([action, search])
+    )
+    
     context = {
-        'history': history[:100],
+        'history': pagination['page_obj'],
         'selected_action': action,
         'search': search,
+        **pagination,
     }
     return render(request, 'assets/history_list.html', context)
 
 
+class Echo:
+    """File-like object whose write() hands the value back, for csv.writer streaming"""
+    
+    def write(self, value):
+        return value
+
+
+@login_required
+def export_history_csv(request):
+    """Export the filtered history log as CSV"""
+    history, action, search = filter_history(request)
+    
+    writer = csv.writer(Echo())
+    
+    def rows():
+        yield writer.writerow(['Date/Time', 'Asset Tag', 'Action', 'Description', 'Performed By'])
+        # Stream rows in chunks rather than materialising the whole log
+        for h in history.order_by('-created_at').iterator(chunk_size=500):
+            yield writer.writerow([
+                h.created_at.strftime('%Y-%m-%d %H:%M'),
+                h.asset.asset_tag,
+                h.get_action_display(),
+                h.description or '',
+                h.performed_by.username if h.performed_by else '',
+            ])
+    
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="history_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    
+    return response
+
+
 # ============================================
 # USER MANAGEMENT
 # ============================================
 
 def is_admin(user):
-    return user.is_superuser or user.groups.filter(name='Admin').exists()
+    # Memoised on the user object, which lives for the whole request
+    cached = getattr(user, '_is_admin_cached', None)
+    if cached is None:
+        cached = user.is_superuser or user.groups.filter(name='Admin').exists()
+        user._is_admin_cached = cached
+    return cached
+
+
+GROUPS_CACHE_TIMEOUT = 600
+
+
+def all_groups():
+    """Role choices as id/name dicts, cached since groups rarely change"""
+    return cache.get_or_set(
+        GROUPS_CACHE_KEY,
+        lambda: list(Group.objects.order_by('name').values('id', 'name')),
+        GROUPS_CACHE_TIMEOUT
+    )
 
 
 @login_required
 @user_passes_test(is_admin)
 def user_list(request):
     """List all users (admin only)"""
-    users = User.objects.all().order_by('-date_joined')
-    groups = Group.objects.all()
+    users = User.objects.prefetch_related('groups').only(
+        'username', 'first_name', 'last_name', 'email',
+        'is_superuser', 'is_active', 'last_login', 'date_joined'
+    ).order_by('-date_joined')
+    groups = all_groups()
+    
+    pagination = paginate(request, users, filters_applied=False)
     
     context = {
-        'users': users,
+        'users': pagination['page_obj'],
         'groups': groups,
+        **pagination,
     }
     return render(request, 'assets/user_list.html', context)
 
@@ -1203,7 +1574,8 @@ def user_detail(request, pk):
     context = {
         'user_obj': user_obj,
         'activity': activity,
-        'groups': Group.objects.all(),
+        'groups': all_groups(),
+        'user_group_ids': set(user_obj.groups.values_list('id', flat=True)),
     }
     return render(request, 'assets/user_detail.html', context)
 
@@ -1212,17 +1584,20 @@ def user_detail(request, pk):
 @user_passes_test(is_admin)
 def user_toggle_active(request, pk):
     """Toggle user active status"""
-    user_obj = get_object_or_404(User, pk=pk)
-    
-    if user_obj == request.user:
+    if pk == request.user.pk:
         messages.error(request, "You cannot deactivate yourself")
         return redirect('assets:user_list')
     
-    user_obj.is_active = not user_obj.is_active
-    user_obj.save()
+    # Flip the flag in the database without loading and rewriting the whole row
+    User.objects.filter(pk=pk).update(
+        is_active=Case(When(is_active=True, then=Value(False)), default=Value(True))
+    )
+    username, is_active = get_object_or_404(
+        User.objects.values_list('username', 'is_active'), pk=pk
+    )
     
-    status = "activated" if user_obj.is_active else "deactivated"
-    messages.success(request, f"User {user_obj.username} has been {status}")
+    status = "activated" if is_active else "deactivated"
+    messages.success(request, f"User {username} has been {status}")
     
     return redirect('assets:user_list')
 
@@ -1232,17 +1607,16 @@ def user_toggle_active(request, pk):
 def user_change_role(request, pk):
     """Change user role/group"""
     if request.method == 'POST':
-        user_obj = get_object_or_404(User, pk=pk)
+        user_obj = get_object_or_404(User.objects.only('username'), pk=pk)
         group_id = request.POST.get('group_id')
         
-        # Clear existing groups
-        user_obj.groups.clear()
-        
         if group_id:
-            group = get_object_or_404(Group, pk=group_id)
-            user_obj.groups.add(group)
+            group = get_object_or_404(Group.objects.only('name'), pk=group_id)
+            # set() diffs against current membership, writing only what changed
+            user_obj.groups.set([group])
             messages.success(request, f"User {user_obj.username} added to {group.name} group")
         else:
+            user_obj.groups.clear()
             messages.success(request, f"User {user_obj.username} removed from all groups")
     
     return redirect('assets:user_detail', pk=pk)
@@ -1261,32 +1635,42 @@ def create_user(request):
         is_staff = request.POST.get('is_staff', False)
         group_id = request.POST.get('group_id')
         
-        if User.objects.filter(username=username).exists():
+        # One lookup covers both the username and the email check
+        clashes = list(User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values_list('username', flat=True))
+        
+        if username in clashes:
             messages.error(request, 'Username already exists')
             return redirect('assets:create_user')
         
-        if User.objects.filter(email=email).exists():
+        if clashes:
             messages.error(request, 'Email already exists')
             return redirect('assets:create_user')
         
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
-            first_name=first_name,
-            last_name=last_name,
-            is_staff=bool(is_staff),
-        )
-        
-        if group_id:
-            group = get_object_or_404(Group, pk=group_id)
-            user.groups.add(group)
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password,
+                    first_name=first_name,
+                    last_name=last_name,
+                    is_staff=bool(is_staff),
+                )
+                
+                # The foreign key validates the role; no separate Group lookup needed
+                if group_id:
+                    user.groups.set([group_id])
+        except IntegrityError:
+            messages.error(request, 'Selected role does not exist')
+            return redirect('assets:create_user')
         
         messages.success(request, f'User {username} created successfully')
         return redirect('assets:user_list')
     
     context = {
-        'groups': Group.objects.all(),
+        'groups': all_groups(),
     }
     return render(request, 'assets/create_user.html', context)
 
@@ -1302,8 +1686,17 @@ def setup_roles(request):
         {'name': 'Viewer', 'description': 'Read-only access'},
     ]
     
-    for role in roles:
-        Group.objects.get_or_create(name=role['name'])
+    names = [role['name'] for role in roles]
+    
+    with transaction.atomic():
+        existing = set(Group.objects.filter(name__in=names).values_list('name', flat=True))
+        Group.objects.bulk_create(
+            [Group(name=name) for name in names if name not in existing],
+            ignore_conflicts=True
+        )
+    
+    # bulk_create skips post_save, so drop the cached role list here
+    cache.delete(GROUPS_CACHE_KEY)
     
     messages.success(request, 'Default roles created: Admin, Manager, Technician, Viewer')
     return redirect('assets:user_list')
@@ -0,0 +1,10 @@
+# Connect the SQLite PRAGMA setup before any database connection is opened
+from . import sqlite  # noqa: F401
+
+try:
+    from .celery import app as celery_app
+except ImportError:
+    # Celery is optional; tasks fall back to running inline
+    celery_app = None
+
+__all__ = ('celery_app',)
@@ -0,0 +1,12 @@
+from django.middleware.gzip import GZipMiddleware
+
+
+class TextGZipMiddleware(GZipMiddleware):
+    """GZip only textual responses; xlsx, PDF and PNG downloads are already compressed"""
+    
+    COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript')
+    
+    def process_response(self, request, response):
+        if not response.get('Content-Type', '').startswith(self.COMPRESSIBLE_TYPES):
+            return response
+        return super().process_response(request, response)
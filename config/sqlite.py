@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Apply SQLITE_PRAGMAS (WAL, relaxed fsync, larger page cache) to new connections"""
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            for pragma in getattr(settings, 'SQLITE_PRAGMAS', []):
+                cursor.execute(pragma)